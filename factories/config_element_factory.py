@@ -36,21 +36,28 @@ class ConfigElementFactory:
         """
         elements = []
 
+        # bind the class constants and methods to locals once, rather than looking them up for every element
+        invalid_id = ConfigElementFactory.INVALID_ID
+        no_ref_element = ConfigElementFactory.NO_REF_ELEMENT
+        element_creators = ConfigElementFactory._ELEMENT_CREATORS
+        add_element = elements.append
+
         for element_type, element_data in generator:
-            element_id = element_data.get('id', ConfigElementFactory.INVALID_ID)
-            element_name = element_data.get('name', ConfigElementFactory.NO_REF_ELEMENT)
+            element_id = element_data.get('id', invalid_id)
+            element_name = element_data.get('name', no_ref_element)
 
-            if element_id == ConfigElementFactory.INVALID_ID:
+            if element_id == invalid_id:
                 raise ValueError(f"Invalid element id: {element_data}")
 
-            if element_type == ConfigElementFactory.ELEMENT_TARGET:
-                elements.append(ConfigElementFactory._create_target(element_name, element_id, element_data))
-            else:
+            create_element = element_creators.get(element_type)
+            if create_element is None:
                 raise ValueError(
                     f"Invalid element type: {element_type}, possibly missing either a css selector, "
                     f"a search hierarchy, or tags and attributes"
                 )
 
+            add_element(create_element(element_name, element_id, element_data))
+
         return elements
 
     @staticmethod
@@ -64,8 +71,10 @@ class ConfigElementFactory:
 
         :return: TargetElement: The created TargetElement.
         """
-        formatted_attrs = TargetElement.collect_attributes(element_data.get('attributes', []))
-        search_hierarchy = element_data.get('search_hierarchy', [])
+        # most elements only set a css selector, so the attribute collection is skipped when there's nothing to collect
+        attributes = element_data.get('attributes')
+        formatted_attrs = TargetElement.collect_attributes(attributes) if attributes else {}
+        search_hierarchy = element_data.get('search_hierarchy')
 
         if search_hierarchy and formatted_attrs:
             raise ValueError(
@@ -79,7 +88,8 @@ class ConfigElementFactory:
             css_selector = element_data.get('css_selector', '')
 
             if css_selector:
-                formatted_attrs = TargetElement.collect_attributes([{'css_selector': css_selector}])
+                # same result as collecting [{'css_selector': css_selector}], without the intermediate list
+                formatted_attrs = {'css_selector': css_selector}
 
         # Convert attributes into a search hierarchy to simplify the scraping process.
         if search_hierarchy:
@@ -99,4 +109,23 @@ class ConfigElementFactory:
         :param element_selectors: List of SelectorElement or TargetElement.
         :param data_order: The desired order of elements.
         """
-        element_selectors.sort(key=lambda x: data_order.index(x.name))
+        # map each name to its position once, instead of scanning data_order for every element
+        # a repeated name keeps its first position, as data_order.index would give
+        order = {}
+        for index, element_name in enumerate(data_order):
+            order.setdefault(element_name, index)
+
+        # the config loader already sorts the elements, in that case they line up with the de-duplicated
+        # data order and there's nothing to do
+        if len(element_selectors) <= len(order) and \
+                all(element.name == element_name for element, element_name in zip(element_selectors, order)):
+            return
+
+        for element in element_selectors:
+            if element.name not in order:
+                raise ValueError(f"Element name not in data order: {element.name}")
+
+        element_selectors.sort(key=lambda element: order[element.name])
+
+    # maps an element type to the method that creates it, new element types only need an entry here
+    _ELEMENT_CREATORS = {ELEMENT_TARGET: _create_target}
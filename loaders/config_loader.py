@@ -1,7 +1,15 @@
 import json
 import logging
 
-from typing import Dict, List, Any, Tuple, Generator
+from functools import cached_property
+
+try:
+    # orjson is optional, it parses large configs considerably faster than the json module
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from typing import Dict, List, Any, Tuple, Generator, Iterator
 
 from loaders.response_loader import ResponseLoader
 from scraping.crawler import Crawler
@@ -19,28 +27,34 @@ class ConfigLoader:
     Attributes:
         config_file_path (str): The path to the configuration file.
         config_data (dict): The loaded configuration data.
-        _total_elements (int): Total number of elements.
+        _raw_elements (list): The raw element configurations from the config data.
         _element_names (set): Set of element names.
-        _target_url_table (dict): Table of target URLs and their options.
+        _elements_by_id (dict): Raw element configurations indexed by their ID.
+        _classified_elements (list): Cached (element type, raw element) pairs, built on first use.
+        _target_urls (list): Target URLs in the order they're configured, built on first use.
+        _target_url_table (dict): Table of target URLs and their options, built on first use.
+        _sub_page_only_urls (frozenset): Target URLs that are set to only scrape sub-pages, built on first use.
         _parsing_options_cache (dict): Cache for data parsing options.
     """
 
     def __init__(self, config_file_path: str):
         self.config_file_path = config_file_path
 
+        # the logger is created first, formatting the config can already log
+        self._logger = CLogger("ConfigLoafer", logging.INFO, {logging.StreamHandler(): logging.INFO})
+
         self.config_data = self.load_config()
+        self._raw_elements = self.config_data.get("elements", [])
 
-        self._total_elements = 0
         self._element_names = set()
+        self._elements_by_id = {}
+        self._classified_elements = None
 
-        self._target_url_table = {}
         self._parsing_options_cache = {}
 
-        self._build_target_url_table()
+        # the target url tables are cached properties, they're only built once a crawler or scraper needs them
         self.format_config()
 
-        self._logger = CLogger("ConfigLoafer", logging.INFO, {logging.StreamHandler(): logging.INFO})
-
     def load_config(self) -> dict:
         """
         Load configuration data from the specified file.
@@ -53,8 +67,9 @@ class ConfigLoader:
             json.JSONDecodeError: If there's an issue with JSON decoding.
         """
         try:
-            with open(self.config_file_path) as file:
-                return json.load(file)
+            # the file is read as bytes, so the parser decodes the utf-8 itself
+            with open(self.config_file_path, 'rb') as file:
+                return _json_loads(file.read())
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Config file not found: {self.config_file_path}") from e
         except json.JSONDecodeError as e:
@@ -64,17 +79,19 @@ class ConfigLoader:
         """
         Get a list of target URLs from the configuration data.
 
+        Note:
+            The list is built once when the config is loaded and shared between calls, so it shouldn't be modified.
+
         Returns:
             List[str]: List of target URLs.
 
         Raises:
             ValueError: If no valid URLs are found in the configuration.
         """
-        urls = [url.get('url') for url in self.config_data.get("target_urls", []) if url.get('url')]
-        if not urls:
+        if not self._target_urls:
             raise ValueError(f"No valid URLs found in config: {self.config_file_path}")
 
-        return urls
+        return self._target_urls
 
     def get_crawlers(self) -> Generator[Crawler, Any, Any]:
         """
@@ -86,22 +103,19 @@ class ConfigLoader:
         NO_CRAWLER_FOUND = 'no_crawler_found'
 
         seeds = self.get_target_urls()
-        # loop over all the target urls and try and get the crawler settings related to the url
-        # the crawler_options_collection is a list of the json data for each crawler in the config file
-        crawler_options_collection = [crawler_data.get('crawler', NO_CRAWLER_FOUND) for crawler_data in
-                                      self.config_data.get('target_urls')]
-        # for every target_url there's an url, so we can safely use the index from crawler_options_collection to
-        # index the seeds list as they are in the same order and of the same length
-        for index, crawler_options_raw_data in enumerate(crawler_options_collection):
+        # the seeds are the target urls that have an url, so pairing them with those same entries keeps both
+        # in the same order without building a separate list of crawler options
+        target_urls = (url_data for url_data in self.config_data.get('target_urls', []) if url_data.get('url'))
+        for seed, url_data in zip(seeds, target_urls):
+            crawler_options_raw_data = url_data.get('crawler', NO_CRAWLER_FOUND)
             # a flag to indicate if the crawler needs to render each url
-            render_pages = self._target_url_table.get(seeds[index], {}).get('render_pages', False)
+            render_pages = self._target_url_table[seed].get('render_pages', False)
             if crawler_options_raw_data == NO_CRAWLER_FOUND:
                 # create a default crawler if one was not specified
-                crawler = Crawler(seeds[index], [ResponseLoader.get_domain(seeds[index])],
-                                  render_pages=render_pages)
+                crawler = Crawler(seed, [ResponseLoader.get_domain(seed)], render_pages=render_pages)
             # else a crawler was specified, and we will use that data to initialize the crawler
             else:
-                crawler = Crawler(seeds[index], [], render_pages=render_pages)
+                crawler = Crawler(seed, [], render_pages=render_pages)
                 Deserializer.deserialize(crawler, crawler_options_raw_data)
             yield crawler
 
@@ -115,27 +129,27 @@ class ConfigLoader:
         Returns:
             bool: True if only sub-pages are to be scraped, False otherwise.
         """
-        if self._target_url_table:
-            return self._target_url_table.get(url, {}).get('only_scrape_sub_pages', False)
+        return url in self._sub_page_only_urls
 
-    def get_raw_target_elements(self) -> Generator[Tuple[str, Dict[Any, Any]], None, None]:
+    def get_raw_target_elements(self) -> Iterator[Tuple[str, Dict[Any, Any]]]:
         """
-        Generate raw target elements or selectors from the configuration.
+        Get the raw target elements or selectors from the configuration.
 
-        Yields:
-            Tuple[str, Dict[Any, Any]]: A tuple where the first element is 'target' or 'selector',
-                                       and the second element is the raw element configuration.
+        Returns:
+            Iterator[Tuple[str, Dict[Any, Any]]]: Tuples where the first element is 'target' or 'BAD SELECTOR',
+                                                  and the second element is the raw element configuration.
         """
-        elements = self.config_data.get("elements", [])
-
-        for element in elements:
-            element_type = "BAD SELECTOR"
-            # we treat search hierarchies the same as target elements as all target elements are
-            # formatted into search hierarchies
-            if element.get('search_hierarchy', '') or element.get('css_selector', ''):
-                element_type = "target"
-
-            yield element_type, element
+        # the elements are classified once, every later call iterates the cached pairs
+        if self._classified_elements is None:
+            self._classified_elements = [
+                # we treat search hierarchies the same as target elements as all target elements are
+                # formatted into search hierarchies
+                ("target" if element.get('search_hierarchy', '') or element.get('css_selector', '')
+                 else "BAD SELECTOR", element)
+                for element in self._raw_elements
+            ]
+
+        return iter(self._classified_elements)
 
     def get_data_parsing_options(self, element_id: int) -> dict:
         """
@@ -149,22 +163,20 @@ class ConfigLoader:
         """
         options = self._parsing_options_cache.get(element_id)
 
-        if options:
+        if options is not None:
             return options
 
-        for _, element in self.get_raw_target_elements():
-            if element.get("id") != element_id:
-                continue
-
-            element_parsing_data = element.get('data_parsing', '')
-            if not element_parsing_data:
-                self._logger.info(f"element has no data parsing options specified, collect data will be ignored: {element}")
-            else:
-                self._parsing_options_cache.update({element_id: element_parsing_data})
+        element = self._elements_by_id.get(element_id)
+        if element is None:
+            return {}
 
-            return element_parsing_data
+        element_parsing_data = element.get('data_parsing') or {}
+        if not element_parsing_data:
+            self._logger.info("element has no data parsing options specified, collect data will be ignored: %s", element)
 
-        return {}
+        # elements without options are cached too, so they're only looked up and logged once
+        self._parsing_options_cache[element_id] = element_parsing_data
+        return element_parsing_data
 
     def get_saving_data(self) -> Dict[Any, Any]:
         """
@@ -187,38 +199,73 @@ class ConfigLoader:
         """
         data_order = self.config_data.get('data_order', [])
 
-        if len(data_order) != self._total_elements:
-            for element_name in self._element_names:
-                if element_name not in data_order:
-                    data_order.append(element_name)
+        # dict keys keep insertion order, so this drops repeated names and keeps their first position
+        unique_data_order = list(dict.fromkeys(data_order))
 
-        unique_data_order = []
-        for item in data_order:
-            if item not in unique_data_order:
-                unique_data_order.append(item)
+        for item in unique_data_order:
             if item not in self._element_names:
                 raise ValueError(f"Unknown name in data-order: {item}")
+
+        # the elements are already sorted by the data order, so unlisted names are appended in config order
+        listed_names = set(unique_data_order)
+        for element in self._raw_elements:
+            name = element["name"]
+            if name not in listed_names:
+                listed_names.add(name)
+                unique_data_order.append(name)
         return unique_data_order
 
     def format_config(self) -> None:
         """
-        Format the configuration data by setting defaults and IDs for elements.
+        Format the configuration data by setting defaults and IDs for elements, and sort the elements
+        by the data order.
         """
-        for index, (_, element) in enumerate(self.get_raw_target_elements()):
+        # ids and names don't depend on the element type, so the raw list is used instead of classifying it
+        for index, element in enumerate(self._raw_elements):
             element["id"] = index
-            element_name = element.get('name', None)
-            if not element_name:
+            self._elements_by_id[index] = element
+            if not element.get('name'):
                 element["name"] = f"element {index}"
-            self._element_names.add(element_name)
+            self._element_names.add(element["name"])
+
+        # put the elements in data order once here, so the factory receives them already sorted,
+        # elements missing from the data order keep their config order at the end
+        data_order = self.config_data.get('data_order')
+        if data_order:
+            # a repeated name keeps its first position, the same one get_data_order uses
+            order = {}
+            for index, element_name in enumerate(data_order):
+                order.setdefault(element_name, index)
+            self._raw_elements.sort(key=lambda element: order.get(element["name"], len(order)))
+
+    @cached_property
+    def _target_urls(self) -> List[str]:
+        """
+        The target URLs in the order they're configured, built on first use.
+        """
+        return [url for url_data in self.config_data.get('target_urls', []) if (url := url_data.get('url'))]
 
-    def _build_target_url_table(self) -> None:
+    @cached_property
+    def _target_url_table(self) -> Dict[str, Dict[str, bool]]:
         """
-        Build the target URL table using configuration data.
+        The table of target URLs and their options, built on first use.
         """
+        target_url_table = {}
         for url_data in self.config_data.get('target_urls', []):
             url = url_data.get('url')
             options = url_data.get('options', {})
-            self._target_url_table.update({url: self._build_options(url, options)})
+            target_url_table[url] = self._build_options(url, options)
+        return target_url_table
+
+    @cached_property
+    def _sub_page_only_urls(self) -> frozenset:
+        """
+        The target URLs that are set to only scrape sub-pages, built on first use.
+        """
+        # only_scrape_sub_pages is checked for every scraped url, so resolve it to a set once
+        return frozenset(
+            url for url, options in self._target_url_table.items() if options.get('only_scrape_sub_pages')
+        )
 
     def _build_options(self, url: str, options: Dict) -> Dict[str, bool]:
         """
@@ -235,7 +282,8 @@ class ConfigLoader:
         for option in DEFAULT_OPTIONS:
             if options.get(option) is None:
                 self._logger.warning(
-                    f"missing options argument in target url: {url} missing option: {option}, defaulting to {DEFAULT_OPTIONS[option]}"
+                    "missing options argument in target url: %s missing option: %s, defaulting to %s",
+                    url, option, DEFAULT_OPTIONS[option]
                 )
-                options.update({option: DEFAULT_OPTIONS[option]})
+                options[option] = DEFAULT_OPTIONS[option]
         return options
@@ -3,11 +3,12 @@ import asyncio
 import logging
 
 from enum import Enum
+from functools import lru_cache
 from typing import Coroutine, Dict, AsyncGenerator, List, Set, Tuple, Generator, Any
 from aiohttp import ClientTimeout
 from urllib.parse import urlsplit, urlunsplit, urljoin, urlparse
 from playwright.async_api import Page, Request, Locator
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser
 from EVNTDispatch import EventDispatcher, PEvent, EventType
 
 from scraping.page_manager import BrowserManager
@@ -22,6 +23,8 @@ class ScrapedResponse:
         self.url: str = url
         self.href_elements: List[Locator] = href_elements
         self.page: Page = page
+        # set by ResponseLoader.load_responses, the scraper and the crawler share this one parse of the page
+        self.parser: LexborHTMLParser = None
 
     def __eq__(self, other):
         if isinstance(other, ScrapedResponse):
@@ -194,7 +197,8 @@ class ResponseLoader:
 
         Note:
             This method loads responses from the provided URLs. If rendering pages is enabled, it will render pages
-            with JavaScript. The method triggers a "new_responses" event with the loaded response data.
+            with JavaScript. Every loaded page is parsed once and the parser is set on its response. The method
+            triggers a "new_responses" event with the parsed pages, unless none of the responses could be loaded.
         """
 
         response_method = cls.get_rendered_response if render_pages \
@@ -202,20 +206,31 @@ class ResponseLoader:
         tasks = [response_method(url) for url in urls]
 
         results = {}
-        html_responses = []
         async for result in cls._generate_responses(tasks, urls):
             url, scraped_response = result
 
             cls._log_response(scraped_response)
 
             if scraped_response.status_code == cls._BAD_RESPONSE_CODE:
-                cls._logger.warning(f"Bad response: {url}")
+                cls._logger.warning("Bad response: %s", url)
                 continue
 
-            html_responses.append({url: scraped_response.html})
-            results.update({url: scraped_response})
+            results[url] = scraped_response
 
-        ResponseLoader._event_dispatcher.sync_trigger(PEvent("new_responses", EventType.Base, data=html_responses))
+        # a round where every request failed has nothing to scrape, so no event is sent for it
+        if results:
+            # each page is parsed exactly once, before the scraper and the crawler use it. lexbor releases the
+            # GIL while parsing, so the pages are parsed concurrently in worker threads
+            parsers = await asyncio.gather(
+                *(asyncio.to_thread(LexborHTMLParser, scraped_response.html) for scraped_response in results.values())
+            )
+            for scraped_response, parser in zip(results.values(), parsers):
+                scraped_response.parser = parser
+
+            parsed_responses = [{url: scraped_response.parser} for url, scraped_response in results.items()]
+            ResponseLoader._event_dispatcher.sync_trigger(
+                PEvent("new_responses", EventType.Base, data=parsed_responses)
+            )
         return results
 
     @classmethod
@@ -237,7 +252,20 @@ class ResponseLoader:
         return cls.normalize_url(url)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def get_domain(url: str) -> str:
+        """
+        Get the domain (network location) of a URL.
+
+        Note:
+            The crawler checks the domain of every child URL it finds, so results are cached.
+
+        Args:
+            url (str): The URL to get the domain from.
+
+        Returns:
+            str: The domain of the URL.
+        """
         return urlparse(url).netloc
 
     @classmethod
@@ -264,11 +292,20 @@ class ResponseLoader:
         return hrefs_to_click
 
     @classmethod
-    def get_hrefs_from_html(cls, html: str) -> Generator[str, Any, Any]:
-        parser = HTMLParser(html)
-        for a_tag in parser.css("a"):
-            href = a_tag.attributes.get("href")
-            if href in cls._hrefs_values_to_click:
+    def get_hrefs_from_parser(cls, parser: LexborHTMLParser) -> Generator[str, Any, Any]:
+        """
+        Get the href values of the links in a parsed page.
+
+        Args:
+            parser (LexborHTMLParser): The parsed page.
+
+        Yields:
+            str: The href values, excluding empty ones and the ones that have to be clicked.
+        """
+        # only anchors that carry an href are matched, the rest of the tree is never visited
+        for a_tag in parser.css('a[href]'):
+            href = a_tag.attributes['href']
+            if not href or href in cls._hrefs_values_to_click:
                 continue
             yield href
 
@@ -289,15 +326,13 @@ class ResponseLoader:
 
         for url, response_info in zip(urls, responses):
             if isinstance(response_info, Exception):
-                cls._logger.error(f"Responses Error: {response_info}")
+                cls._logger.error("Responses Error: %s", response_info)
                 continue
             yield url, response_info
 
     @classmethod
     def _log_response(cls, response: ScrapedResponse) -> None:
-        message = f"URL={response.url}, Status={response.status_code}"
-
         if response.status_code == cls._BAD_RESPONSE_CODE:
-            cls._logger.warning(f"Bad Response Received: {message}")
+            cls._logger.warning("Bad Response Received: URL=%s, Status=%s", response.url, response.status_code)
         else:
-            cls._logger.info(f"Good Response Received: {message}")
+            cls._logger.info("Good Response Received: URL=%s, Status=%s", response.url, response.status_code)
@@ -1,17 +1,17 @@
 from typing import Generator, List
 from dataclasses import dataclass
 
-from selectolax.parser import Node
+from selectolax.lexbor import LexborNode
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedData:
     """Class for holding scraped data"""
     url: str
-    nodes: List[Node]
+    nodes: List[LexborNode]
     target_element_id: int
 
-    def get_nodes(self) -> Generator[Node, None, None]:
+    def get_nodes(self) -> Generator[LexborNode, None, None]:
         for node in self.nodes:
             yield node
 
@@ -174,8 +174,18 @@ class TargetElement:
         """
         Creates a search hierarchy based on the current attributes.
 
+        All the attributes describe the same element, so they're combined into a single compound selector,
+        e.g. {'class': 'price_color', 'id': 'p1'} becomes ['.price_color[id=p1]']. A css selector next to
+        other attributes is wrapped in :is() so it has to match that same element too.
+
         Note:
             Make sure the attributes have been formatted before using this method
         """
+        css_selector = formatted_attrs.get('css_selector', '')
+        attributes = {name: value for name, value in formatted_attrs.items() if name != 'css_selector'}
+
+        compound_selector = ''.join(self.format_css_selectors(attributes))
+        if css_selector:
+            compound_selector = f"{compound_selector}:is({css_selector})" if compound_selector else css_selector
 
-        self.search_hierarchy = self.format_search_hierarchy_from_attributes([formatted_attrs])
+        self.search_hierarchy = [compound_selector] if compound_selector else []
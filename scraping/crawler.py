@@ -2,7 +2,7 @@ import asyncio
 import logging
 import re
 
-from typing import List, Any, Generator, Iterable, Set, Dict
+from typing import List, Any, Generator, Iterable, Set, Dict, Pattern
 from urllib.robotparser import RobotFileParser
 
 from playwright.async_api import Locator
@@ -24,7 +24,7 @@ class Crawler:
     ignore_robots_txt (bool, optional): If True, ignore robots.txt rules. Defaults to False.
     crawl_delay (float, optional): Delay between requests in seconds. Defaults to 1.
     loop (asyncio.AbstractEventLoop, optional): Custom event loop to use. If not provided,
-        a new event loop will be created. Defaults to None.
+        the running loop is used when the crawler is started, or a new one is created. Defaults to None.
     user_agent (str, optional): User-Agent string for requests. Defaults to "*".
     """
 
@@ -49,7 +49,9 @@ class Crawler:
         self.url_patterns = url_patters
 
         self._current_depth = 0
-        self._loop = None
+        self._url_pattern_source = ()
+        self._url_pattern_regexes = []
+        self._loop = loop
         self._to_visit = set()
         self._visited = set()
         self._clicked_elements = set()
@@ -63,9 +65,6 @@ class Crawler:
         self._robot_parser.set_url(self._get_robot_txt_url())
         self._robot_parser.read()
 
-        # set event loop
-        self._set_event_loop(loop=loop)
-
         self._logger = CLogger("Crawler", logging.INFO, {logging.StreamHandler(): logging.INFO})
 
     @property
@@ -90,14 +89,22 @@ class Crawler:
         # add the initial link to the to-vist set
         self._to_visit.add(self.seed)
 
+        # the loop is looked up here rather than in __init__, so the crawler runs on the loop it's started from
+        self._set_event_loop(loop=self._loop)
+
         task = self._loop.create_task(self._run())
         self._running_tasks.add(task)
+        task.add_done_callback(self._on_task_done)
 
     async def exit(self) -> None:
         """
         Waits for all crawling task to finish and print summary statistics on exit.
+
+        Note:
+            A failing crawl task is logged by _on_task_done instead of raised, so the browser is always closed.
         """
-        await asyncio.gather(*self._running_tasks)
+        await asyncio.gather(*self._running_tasks, return_exceptions=True)
+
         await BrowserManager.close()
 
         print("TOTAL SITES VISITED:", len(self._visited))
@@ -116,8 +123,8 @@ class Crawler:
             str:  URLs that meet the specified conditions.
         """
         for base_url, response in zip(urls, scraped_responses):
-            # iterate through each href in the html
-            for href in ResponseLoader.get_hrefs_from_html(response.html):
+            # iterate through each href in the page, which the response loader has already parsed
+            for href in ResponseLoader.get_hrefs_from_parser(response.parser):
                 child_url = ResponseLoader.build_link(base_url, href)
                 if child_url not in self._visited and self._is_url_allowed(child_url):
                     yield child_url
@@ -132,7 +139,7 @@ class Crawler:
         new_urls = set()
         while self._to_visit and self._current_depth <= self.max_depth:
             # Log crawler status
-            self._logger.info(f"DEPTH {self._current_depth}")
+            self._logger.info("DEPTH %s", self._current_depth)
 
             # populate structure with all the urls to get responses from
             urls_to_get_responses_from = {self._to_visit.pop()} if self.has_crawl_delay else self._to_visit
@@ -152,9 +159,12 @@ class Crawler:
             # Process responses
             await self._process_responses(response_pairs)
 
-            new_urls.update(
-                self.collect_child_urls_from_responses(response_pairs.keys(), response_pairs.values())
+            # collecting the child urls runs a css query and the url checks for every page, so it's done in a
+            # worker thread to keep the event loop free for the dispatcher and the other crawlers
+            child_urls = await asyncio.to_thread(
+                set, self.collect_child_urls_from_responses(response_pairs.keys(), response_pairs.values())
             )
+            new_urls.update(child_urls)
 
             if self.render_pages:
                 await self._collect_button_redirect()
@@ -228,6 +238,19 @@ class Crawler:
         scraped_response.href_elements = unique_locators
         return len(scraped_response.href_elements) > 0
 
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """
+        Stop tracking a finished crawl task, logging its exception if it failed.
+
+        Args:
+            task (asyncio.Task): The crawl task that finished.
+        """
+        self._running_tasks.discard(task)
+
+        # the task may finish before exit() gathers it, so its failure is retrieved and logged here
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error("Crawl task failed: %r", task.exception())
+
     def _set_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """
         Set the event loop, creating a new one if needed.
@@ -279,10 +302,29 @@ class Crawler:
         Returns:
             bool: True if the URL matches a pattern or no patterns are defined; otherwise, False.
         """
-        if not self.url_patterns:
+        url_pattern_regexes = self._get_url_pattern_regexes()
+        if not url_pattern_regexes:
             return True
 
-        return any(re.search(pattern, url) for pattern in self.url_patterns)
+        return any(regex.search(url) for regex in url_pattern_regexes)
+
+    def _get_url_pattern_regexes(self) -> List[Pattern[str]]:
+        """
+        Get the compiled URL patterns, recompiling them when the patterns have changed.
+
+        Note:
+            The patterns can be set by the deserializer after construction or changed later on, so they're
+            compared with the ones that were last compiled instead of being compiled once.
+
+        Returns:
+            List[Pattern[str]]: The compiled URL patterns.
+        """
+        url_patterns = tuple(self.url_patterns or ())
+        if url_patterns != self._url_pattern_source:
+            self._url_pattern_source = url_patterns
+            self._url_pattern_regexes = [re.compile(pattern) for pattern in url_patterns]
+
+        return self._url_pattern_regexes
 
     def _is_url_allowed_by_domain(self, url: str) -> bool:
         """
@@ -1,8 +1,7 @@
-import re
 import logging
 
-from typing import Generator, Tuple, List
-from selectolax.parser import Node
+from typing import Generator, List
+from selectolax.lexbor import LexborNode
 
 from EVNTDispatch import EventDispatcher, PEvent
 from loaders.config_loader import ConfigLoader
@@ -24,45 +23,43 @@ class DataParser:
         if not url_element_pairs:
             return
 
-        cleaned_data = []
+        # the saver interleaves the values into columns by index, so it needs the whole batch
+        await self.data_saver.save(list(self.parse_scraped_data(url_element_pairs)))
 
-        for scraped_data, element_id in self.get_elements(url_element_pairs):
-            parsing_data = self.config.get_data_parsing_options(element_id)
-
-            for node in scraped_data.get_nodes():
-                if parsing_data.get("collect_text"):
-                    text = self.collect_text(node)
-                    cleaned_data.append(text)
-                elif parsing_data.get("remove_tags"):
-                    cleaned_data.append(self.remove_tags(node))
+    def parse_scraped_data(self, scraped_data_list: List[ScrapedData]) -> Generator[str, None, None]:
+        for scraped_data in scraped_data_list:
+            # the parsing options are the same for every node of a scraped element, so they're resolved once
+            parsing_data = self.config.get_data_parsing_options(scraped_data.target_element_id)
+            collect_text = parsing_data.get("collect_text")
+            remove_tags = parsing_data.get("remove_tags")
 
-                attr_data = parsing_data.get("collect_attr_value")
-                if attr_data and attr_data.get('attr_name'):
-                    cleaned_data.append(self.collect_attribute_value(str(node.unwrap()), attr_data['attr_name']))
-                elif attr_data and not attr_data.get('attr_name'):
-                    self.log_missing_attribute_name(attr_data)
+            attr_data = parsing_data.get("collect_attr_value")
+            attr_name = attr_data.get('attr_name') if attr_data else None
+            if attr_data and not attr_name:
+                self.log_missing_attribute_name(attr_data)
 
-        await self.data_saver.save(cleaned_data)
+            for node in scraped_data.nodes:
+                if collect_text:
+                    yield self.collect_text(node)
+                elif remove_tags:
+                    yield self.remove_tags(node)
 
-    @staticmethod
-    def get_elements(scraped_data_list: List[ScrapedData]) -> Generator[Tuple[ScrapedData, int], None, None]:
-        for scraped_data in scraped_data_list:
-            yield scraped_data, scraped_data.target_element_id
+                if attr_name:
+                    yield self.get_attribute_value(node, attr_name)
 
     @staticmethod
-    def collect_attribute_value(attr_name, element_text: str):
-        match = re.search(f'{attr_name}="([^"]*)"', element_text)
-        if match:
-            return match.group(1)
-        return ""
+    def get_attribute_value(node: LexborNode, attr_name: str) -> str:
+        return node.attributes.get(attr_name) or ""
 
     @staticmethod
-    def collect_text(node: Node) -> str:
+    def collect_text(node: LexborNode) -> str:
         return node.text().strip()
 
     @staticmethod
-    def remove_tags(node: Node) -> str:
-        return str(node.unwrap())
+    def remove_tags(node: LexborNode) -> str:
+        # rebuild the inner html from the children rather than unwrapping the node, which would modify
+        # the (shared) parse tree
+        return ''.join(child.html for child in node.iter(include_text=True))
 
     def log_missing_attribute_name(self, attr_data: dict) -> None:
         error_message = (
@@ -49,7 +49,7 @@ class DataSaver:
             save_func = self._save_func_mapping.get(save_type)
 
             if not save_func:
-                self._logger.warning(f"Unknown save type: {save_type}")
+                self._logger.warning("Unknown save type: %s", save_type)
                 continue
 
             await save_func(self.save_config.get(save_type), self.data_keys, len(self.data_keys), self._lock)
@@ -64,7 +64,7 @@ class DataSaver:
             save_func = self._save_func_mapping.get(save_type)
 
             if not save_func:
-                self._logger.warning(f"Unknown save type: {save_type}")
+                self._logger.warning("Unknown save type: %s", save_type)
                 continue
 
             await save_func(self.save_config.get(save_type), data, len(self.data_keys), self._lock)
@@ -139,7 +139,7 @@ class DataSaver:
         for save_type in self.save_types:
             clear_func = self._clear_func_mapping.get(save_type)
             if not clear_func:
-                self._logger.warning(f"Unknown clear type: {save_type}")
+                self._logger.warning("Unknown clear type: %s", save_type)
                 continue
             clear_func(self.save_config.get(save_type))
 
@@ -1,5 +1,6 @@
-from typing import List, Dict
-from selectolax.parser import HTMLParser
+from functools import partial
+from typing import List, Dict, Callable, Tuple
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from EVNTDispatch import EventDispatcher, PEvent, EventType
 from loaders.config_loader import ConfigLoader
@@ -23,6 +24,12 @@ class DataScraper:
         self.config = config
         self.elements = elements
 
+        # the way an element is searched for only depends on its search hierarchy, so it's decided once here
+        # instead of for every page
+        self._element_finders: List[Tuple[TargetElement, Callable[[LexborHTMLParser], List[LexborNode]]]] = [
+            (element, self.build_element_finder(element)) for element in elements
+        ]
+
         self.event_dispatcher = event_dispatcher
         self.event_dispatcher.add_listener("new_responses", self.collect_data)
 
@@ -38,46 +45,76 @@ class DataScraper:
 
         all_scraped_data = []
         for response in responses:
-            scraped_data = self._process_response(response)
-            all_scraped_data.extend(scraped_data)
+            all_scraped_data.extend(self._process_response(response))
 
-        self.event_dispatcher.async_trigger_nw(PEvent("scraped_data", EventType.Base, data=all_scraped_data))
+        # the whole batch goes out in a single event, and nothing is dispatched when every page was skipped
+        if all_scraped_data:
+            self.event_dispatcher.async_trigger_nw(PEvent("scraped_data", EventType.Base, data=all_scraped_data))
 
-    def _process_response(self, response: Dict[str, str]) -> List[ScrapedData]:
+    def _process_response(self, response: Dict[str, LexborHTMLParser]) -> List[ScrapedData]:
         results = []
 
-        for url, content in response.items():
-            parser = HTMLParser(content)
-
+        # the response loader has already parsed every page, the parsers are shared with the crawler
+        for url, parser in response.items():
             if self.config.only_scrape_sub_pages(url):
                 continue
 
-            for element in self.elements:
-                scraped_data = self.collect_all_target_elements(url, element, parser)
-                results.append(scraped_data)
+            for element, find_nodes in self._element_finders:
+                results.append(ScrapedData(url, find_nodes(parser), element.element_id))
 
         return results
 
     @staticmethod
-    def collect_all_target_elements(url: str, target_element: TargetElement, parser: HTMLParser) -> ScrapedData:
+    def collect_all_target_elements(url: str, target_element: TargetElement, parser: LexborHTMLParser) -> ScrapedData:
         """
         Collect data from all target elements specified by the TargetElement.
 
         Args:
             url (str): The URL of the web page.
             target_element (TargetElement): The TargetElement instance representing the element to collect data from.
-            parser (HTMLParser): The Selectolax HTMLParser instance representing the parsed HTML content.
+            parser (LexborHTMLParser): The Selectolax Lexbor parser instance representing the parsed HTML content.
 
         Returns:
             ScrapedData: An instance containing the collected data.
         """
-        result_set = parser.css(
-            target_element.search_hierarchy[0]) if target_element.search_hierarchy else []
+        find_nodes = DataScraper.build_element_finder(target_element)
+        return ScrapedData(url, find_nodes(parser), target_element.element_id)
+
+    @staticmethod
+    def build_element_finder(target_element: TargetElement) -> Callable[[LexborHTMLParser], List[LexborNode]]:
+        """
+        Build a function that collects the nodes matching the TargetElement's search hierarchy.
+
+        Note:
+            Each level of a search hierarchy has to match a descendant of the previous level's nodes,
+            a node matching two consecutive levels itself is not collected.
 
-        if len(target_element.search_hierarchy) <= 1:
-            return ScrapedData(url, result_set, target_element.element_id)
+        Args:
+            target_element (TargetElement): The TargetElement instance representing the element to collect data from.
+
+        Returns:
+            Callable[[LexborHTMLParser], List[LexborNode]]: A function taking a parser and returning the matched nodes.
+        """
+        search_hierarchy = target_element.search_hierarchy
+        if not search_hierarchy:
+            return lambda parser: []
+
+        # the hierarchy levels are chained into one descendant selector, so the tree is only walked once.
+        # unlike the level by level walk, where a node's css() also matches the node itself, every level
+        # has to be a proper descendant of the previous one. attributes of a single element are already
+        # combined into one compound selector, so only real hierarchies are chained. selector groups
+        # can't be chained, so they fall back to the walk
+        if not any(',' in selector for selector in search_hierarchy):
+            selector = ' '.join(search_hierarchy)
+            return lambda parser: parser.css(selector)
+
+        return partial(DataScraper._walk_search_hierarchy, list(search_hierarchy))
+
+    @staticmethod
+    def _walk_search_hierarchy(search_hierarchy: List[str], parser: LexborHTMLParser) -> List[LexborNode]:
+        result_set = parser.css(search_hierarchy[0])
 
-        for attr in target_element.search_hierarchy[1:]:
+        for attr in search_hierarchy[1:]:
             new_result_set = []
             for tag in result_set:
                 temp_result_set = tag.css(attr)
@@ -85,4 +122,4 @@ class DataScraper:
                     new_result_set.extend(temp_result_set)
             result_set = new_result_set
 
-        return ScrapedData(url, result_set, target_element.element_id)
+        return result_set
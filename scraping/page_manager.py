@@ -1,7 +1,11 @@
+import logging
+
 from asyncio import Queue, Lock
 from typing import Set
 from playwright.async_api import Browser, async_playwright, Page
 
+from utils.clogger import CLogger
+
 
 class PagePool:
     _pool: Queue = Queue()
@@ -85,6 +89,8 @@ class BrowserManager:
     _all_pages: Set[Page] = set()
     _lock: Lock = Lock()
 
+    _logger = CLogger("BrowserManager", logging.INFO, {logging.StreamHandler(): logging.INFO})
+
     @classmethod
     async def initialize(cls, is_rendering: bool = False):
         if cls._browser is None and is_rendering:
@@ -180,14 +186,14 @@ class BrowserManager:
         async with cls._lock:
             if feed_into_pool and not PagePool.is_full():
                 if await PagePool.put_page_back(page):
-                    print("RETURN SUCCESS:", page)
+                    cls._logger.debug("Returned page to the pool: %s", page)
                     cls.remove_from_active_pages(page)
             elif not feed_into_pool:
-                print("CLOSING PAGE:", page)
+                cls._logger.debug("Closing page: %s", page)
                 cls.remove_from_active_pages(page)
                 await page.close()
             elif PagePool.is_full():
-                print("FULL POOL")
+                cls._logger.debug("Page pool is full, closing page: %s", page)
                 cls.remove_from_active_pages(page)
                 await page.close()
 
@@ -0,0 +1,56 @@
+import unittest
+
+from factories.config_element_factory import ConfigElementFactory
+
+
+class TestConfigElementFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.raw_elements = [
+            ('target', {'id': 0, 'name': 'Book Price', 'css_selector': 'p.price_color'}),
+            ('target', {'id': 1, 'name': 'Book Name', 'css_selector': 'h1'}),
+            ('target', {'id': 2, 'name': 'Book Stock', 'css_selector': 'p.availability'}),
+        ]
+
+    def test_create_elements_in_data_order(self):
+        data_order = ['Book Name', 'Book Stock', 'Book Price']
+        elements = ConfigElementFactory.create_elements(iter(self.raw_elements), data_order)
+
+        self.assertEqual([element.name for element in elements], data_order)
+        self.assertEqual([element.element_id for element in elements], [1, 2, 0])
+
+    def test_create_elements_already_in_data_order(self):
+        data_order = ['Book Price', 'Book Name', 'Book Stock']
+        elements = ConfigElementFactory.create_elements(iter(self.raw_elements), data_order)
+
+        self.assertEqual([element.name for element in elements], data_order)
+
+    def test_create_elements_with_duplicate_names(self):
+        raw_elements = self.raw_elements[:2] + [('target', {'id': 2, 'name': 'Book Price', 'css_selector': 'p.price'})]
+        elements = ConfigElementFactory.create_elements(iter(raw_elements), ['Book Price', 'Book Name'])
+
+        self.assertEqual([element.element_id for element in elements], [0, 2, 1])
+
+    def test_create_elements_with_repeated_name_in_data_order(self):
+        data_order = ['Book Stock', 'Book Name', 'Book Price', 'Book Stock']
+        elements = ConfigElementFactory.create_elements(iter(self.raw_elements), data_order)
+
+        self.assertEqual([element.name for element in elements], ['Book Stock', 'Book Name', 'Book Price'])
+
+    def test_create_elements_with_repeated_name_in_elements_and_data_order(self):
+        raw_elements = self.raw_elements[:2] + [('target', {'id': 2, 'name': 'Book Price', 'css_selector': 'p.price'})]
+        data_order = ['Book Price', 'Book Name', 'Book Price']
+        elements = ConfigElementFactory.create_elements(iter(raw_elements), data_order)
+
+        self.assertEqual([element.element_id for element in elements], [0, 2, 1])
+
+    def test_create_elements_with_name_missing_from_data_order(self):
+        with self.assertRaises(ValueError):
+            ConfigElementFactory.create_elements(iter(self.raw_elements), ['Book Name', 'Book Price'])
+
+    def test_create_elements_with_bad_selector(self):
+        with self.assertRaises(ValueError):
+            ConfigElementFactory.create_elements(iter([('BAD SELECTOR', {'id': 0, 'name': 'Book'})]), ['Book'])
+
+
+if __name__ == '__main__':
+    unittest.main()
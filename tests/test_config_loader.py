@@ -0,0 +1,123 @@
+import json
+import os
+import tempfile
+import unittest
+
+from loaders.config_loader import ConfigLoader
+
+
+class TestConfigLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config_data = {
+            "target_urls": [
+                {
+                    "url": "https://books.toscrape.com/",
+                    "options": {"only_scrape_sub_pages": True, "render_pages": False}
+                },
+                {
+                    "url": "https://quotes.toscrape.com/",
+                    "options": {"only_scrape_sub_pages": False, "render_pages": False}
+                }
+            ],
+            "elements": [
+                {
+                    "name": "Book Price",
+                    "css_selector": ".product_main p.price_color",
+                    "data_parsing": {"collect_text": True}
+                },
+                {
+                    "name": "Book Name",
+                    "css_selector": "h1"
+                },
+                {
+                    "css_selector": "p.availability"
+                }
+            ],
+            "data_order": ["Book Name", "Book Price"]
+        }
+
+        config_file = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+        with config_file:
+            json.dump(self.config_data, config_file)
+        self.config_file_path = config_file.name
+
+        self.config = ConfigLoader(self.config_file_path)
+
+    def tearDown(self) -> None:
+        os.remove(self.config_file_path)
+
+    def test_only_scrape_sub_pages(self):
+        self.assertTrue(self.config.only_scrape_sub_pages("https://books.toscrape.com/"))
+        self.assertFalse(self.config.only_scrape_sub_pages("https://quotes.toscrape.com/"))
+        self.assertFalse(self.config.only_scrape_sub_pages("https://books.toscrape.com/catalogue/"))
+
+    def test_missing_url_options_default(self):
+        self.config_data["target_urls"].append({"url": "https://toscrape.com/"})
+        with open(self.config_file_path, 'w') as config_file:
+            json.dump(self.config_data, config_file)
+
+        config = ConfigLoader(self.config_file_path)
+
+        self.assertTrue(config.only_scrape_sub_pages("https://toscrape.com/"))
+
+    def test_load_config_with_bad_json(self):
+        with open(self.config_file_path, 'w') as config_file:
+            config_file.write('{"target_urls": [')
+
+        with self.assertRaises(ValueError):
+            ConfigLoader(self.config_file_path)
+
+    def test_elements_sorted_by_data_order(self):
+        names = [element["name"] for _, element in self.config.get_raw_target_elements()]
+
+        self.assertEqual(names, self.config.get_data_order())
+
+    def test_get_data_order(self):
+        self.config_data["data_order"] = ["Book Price", "Book Name", "Book Price"]
+        with open(self.config_file_path, 'w') as config_file:
+            json.dump(self.config_data, config_file)
+        config = ConfigLoader(self.config_file_path)
+
+        self.assertEqual(config.get_data_order(), ["Book Price", "Book Name", "element 2"])
+        self.assertEqual([element["name"] for _, element in config.get_raw_target_elements()],
+                         ["Book Price", "Book Name", "element 2"])
+        self.assertEqual(config.config_data["data_order"], ["Book Price", "Book Name", "Book Price"])
+
+    def test_get_data_order_with_unknown_name(self):
+        self.config.config_data["data_order"].append("Book Rating")
+
+        with self.assertRaises(ValueError):
+            self.config.get_data_order()
+
+    def test_target_url_table_built_on_first_use(self):
+        self.assertNotIn("_target_url_table", vars(self.config))
+
+        self.config.only_scrape_sub_pages("https://books.toscrape.com/")
+        self.assertIn("_target_url_table", vars(self.config))
+
+    def test_get_target_urls(self):
+        urls = ["https://books.toscrape.com/", "https://quotes.toscrape.com/"]
+
+        self.assertEqual(self.config.get_target_urls(), urls)
+        self.assertIs(self.config.get_target_urls(), self.config.get_target_urls())
+
+    def test_get_data_parsing_options(self):
+        self.assertEqual(self.config.get_data_parsing_options(0), {"collect_text": True})
+        self.assertEqual(self.config.get_data_parsing_options(1), {})
+        self.assertEqual(self.config.get_data_parsing_options(99), {})
+
+    def test_get_raw_target_elements(self):
+        expected = [("target", element) for element in self.config.config_data["elements"]]
+
+        self.assertEqual(list(self.config.get_raw_target_elements()), expected)
+        self.assertEqual(list(self.config.get_raw_target_elements()), expected)
+
+    def test_format_config(self):
+        ids = {element["name"]: element["id"] for element in self.config.config_data["elements"]}
+
+        self.assertEqual(ids, {"Book Price": 0, "Book Name": 1, "element 2": 2})
+        self.assertEqual(self.config.get_data_order(), ["Book Name", "Book Price", "element 2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from unittest.mock import patch
+
+from scraping.crawler import Crawler
+
+
+class TestCrawler(unittest.TestCase):
+    def setUp(self) -> None:
+        # the crawler reads robots.txt on construction, the tests don't need the network for that
+        with patch('scraping.crawler.RobotFileParser.read'):
+            self.crawler = Crawler("https://books.toscrape.com/", ["books.toscrape.com"],
+                                   ignore_robots_txt=True, url_patters=[r'catalogue/'])
+
+    def test_url_patterns_apply_before_start(self):
+        self.assertTrue(self.crawler._is_url_allowed("https://books.toscrape.com/catalogue/page-2.html"))
+        self.assertFalse(self.crawler._is_url_allowed("https://books.toscrape.com/other"))
+
+    def test_url_patterns_changed_after_compiling(self):
+        self.assertFalse(self.crawler._is_url_allowed("https://books.toscrape.com/other"))
+
+        self.crawler.url_patterns.append(r'other')
+        self.assertTrue(self.crawler._is_url_allowed("https://books.toscrape.com/other"))
+
+        self.crawler.url_patterns = None
+        self.assertTrue(self.crawler._is_url_allowed("https://books.toscrape.com/anything"))
+
+
+if __name__ == '__main__':
+    unittest.main()
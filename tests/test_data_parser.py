@@ -0,0 +1,67 @@
+import unittest
+
+from selectolax.lexbor import LexborHTMLParser
+from EVNTDispatch import EventDispatcher
+
+from models.scarped_data import ScrapedData
+from scraping.data_parser import DataParser
+
+
+class ParsingOptionsConfig:
+    def __init__(self, parsing_options: dict):
+        self.parsing_options = parsing_options
+
+    def get_data_parsing_options(self, element_id: int) -> dict:
+        return self.parsing_options.get(element_id, {})
+
+
+class TestDataParser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.html = """
+               <div class="product">
+                 <a class="link" href="/book/1">BOOK ONE</a>
+                 <input type="checkbox" checked>
+               </div>
+               """
+
+        self.html_parser = LexborHTMLParser(self.html)
+
+    def test_get_attribute_value(self):
+        node = self.html_parser.css_first("a.link")
+
+        self.assertEqual(DataParser.get_attribute_value(node, "href"), "/book/1")
+        self.assertEqual(DataParser.get_attribute_value(node, "title"), "")
+
+    def test_get_attribute_value_does_not_modify_tree(self):
+        node = self.html_parser.css_first("a.link")
+        DataParser.get_attribute_value(node, "href")
+
+        self.assertEqual(len(self.html_parser.css("a.link")), 1)
+
+    def test_get_attribute_value_without_value(self):
+        node = self.html_parser.css_first("input")
+
+        self.assertEqual(DataParser.get_attribute_value(node, "checked"), "")
+
+    def test_remove_tags(self):
+        parser = LexborHTMLParser('<p class="description">Some <b>bold</b> text</p>')
+        node = parser.css_first("p.description")
+
+        self.assertEqual(DataParser.remove_tags(node), "Some <b>bold</b> text")
+        self.assertEqual(len(parser.css("p.description")), 1)
+
+    def test_parse_scraped_data(self):
+        config = ParsingOptionsConfig({
+            0: {"collect_text": True},
+            1: {"collect_attr_value": {"attr_name": "href"}},
+        })
+        data_parser = DataParser(config, EventDispatcher(), None)
+
+        links = self.html_parser.css("a.link")
+        scraped_data = [ScrapedData("some_url", links, 0), ScrapedData("some_url", links, 1)]
+
+        self.assertEqual(list(data_parser.parse_scraped_data(scraped_data)), ["BOOK ONE", "/book/1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser
 
+from factories.config_element_factory import ConfigElementFactory
 from models.target_element import TargetElement
 from scraping.data_scraper import DataScraper
 
@@ -35,7 +36,7 @@ class TestDataScraper(unittest.TestCase):
             {"name": "class", "value": "child"},
         ]
 
-        self.html_parser = HTMLParser(self.html)
+        self.html_parser = LexborHTMLParser(self.html)
         self.url = "some_url"
 
     def test_collecting_elements_using_raw_search_hierarchy(self):
@@ -73,6 +74,33 @@ class TestDataScraper(unittest.TestCase):
 
         self.assertEqual(first_node.attributes.get('class', ''), 'parent someother_class')
 
+    def test_collecting_element_with_multiple_attributes(self):
+        parser = LexborHTMLParser('<div><p class="price_color" id="p1">£10</p><p class="price_color">£20</p></div>')
+        raw_element = {'id': 0, 'name': 'price', 'attributes': [
+            {'name': 'class', 'value': 'price_color'},
+            {'name': 'id', 'value': 'p1'}
+        ]}
+        target_element = ConfigElementFactory.create_elements(iter([('target', raw_element)]), ['price'])[0]
+
+        scraped_data = DataScraper.collect_all_target_elements(self.url, target_element, parser)
+
+        self.assertEqual([node.text() for node in scraped_data.nodes], ['£10'])
+
+    def test_collecting_elements_using_search_hierarchy_with_selector_group(self):
+        target_element = TargetElement('test_element', 0, ['.grandparent', '.parent, .missing', '.child'])
+
+        scraped_data = DataScraper.collect_all_target_elements(self.url, target_element, self.html_parser)
+
+        self.assertEqual(len(scraped_data.nodes), 1)
+        self.assertEqual(scraped_data.nodes[0].text().strip(), "CHILD ELEMENT")
+
+    def test_collecting_elements_without_search_hierarchy(self):
+        target_element = TargetElement('test_element', 0)
+
+        scraped_data = DataScraper.collect_all_target_elements(self.url, target_element, self.html_parser)
+
+        self.assertEqual(scraped_data.nodes, [])
+
 
 if __name__ == '__main__':
     unittest.main()
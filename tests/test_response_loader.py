@@ -0,0 +1,86 @@
+import unittest
+
+from unittest.mock import patch
+from selectolax.lexbor import LexborHTMLParser
+
+from loaders.response_loader import ResponseLoader, ScrapedResponse
+
+
+class TestResponseLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.html = """
+               <div class="links">
+                 <a href="/page/1">PAGE ONE</a>
+                 <a>NO LINK</a>
+                 <a href>EMPTY LINK</a>
+                 <a href="#">CLICK ELEMENT</a>
+                 <a href="/page/2">PAGE TWO</a>
+               </div>
+               """
+
+    def test_get_hrefs_from_parser(self):
+        hrefs = list(ResponseLoader.get_hrefs_from_parser(LexborHTMLParser(self.html)))
+
+        self.assertEqual(hrefs, ['/page/1', '/page/2'])
+
+    def test_get_hrefs_from_parser_without_links(self):
+        self.assertEqual(list(ResponseLoader.get_hrefs_from_parser(LexborHTMLParser('<p>NO LINKS</p>'))), [])
+        self.assertEqual(
+            list(ResponseLoader.get_hrefs_from_parser(LexborHTMLParser('<A HREF="/page/1">PAGE ONE</A>'))), ['/page/1']
+        )
+
+    def test_get_domain(self):
+        self.assertEqual(ResponseLoader.get_domain("https://books.toscrape.com/catalogue/page-2.html"),
+                         "books.toscrape.com")
+        self.assertEqual(ResponseLoader.get_domain("/catalogue/page-2.html"), "")
+
+
+
+class EventRecorder:
+    def __init__(self):
+        self.events = []
+
+    def sync_trigger(self, event) -> None:
+        self.events.append(event)
+
+
+class TestLoadResponses(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.event_recorder = EventRecorder()
+        ResponseLoader.setup(event_dispatcher=self.event_recorder)
+
+    async def asyncTearDown(self) -> None:
+        ResponseLoader.setup(event_dispatcher=None)
+
+    async def test_load_responses_parses_each_page_once(self):
+        async def get_response(url):
+            return ScrapedResponse(f'<a href="{url}next">NEXT</a>', 200, url)
+
+        urls = ["https://books.toscrape.com/", "https://quotes.toscrape.com/"]
+        with patch.object(ResponseLoader, 'get_response', get_response):
+            results = await ResponseLoader.load_responses(urls)
+
+        parsers = {url: response.parser for url, response in results.items()}
+        self.assertEqual(list(ResponseLoader.get_hrefs_from_parser(parsers[urls[0]])), [f"{urls[0]}next"])
+
+        # the scraper receives the same parsers the crawler uses
+        event_parsers = {
+            url: parser for response in self.event_recorder.events[0].data for url, parser in response.items()
+        }
+        self.assertEqual(event_parsers.keys(), parsers.keys())
+        for url, parser in parsers.items():
+            self.assertIs(event_parsers[url], parser)
+
+    async def test_load_responses_without_good_responses(self):
+        async def get_response(url):
+            return ScrapedResponse("", -1, url)
+
+        with patch.object(ResponseLoader, 'get_response', get_response):
+            results = await ResponseLoader.load_responses(["https://books.toscrape.com/"])
+
+        self.assertEqual(results, {})
+        self.assertEqual(self.event_recorder.events, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
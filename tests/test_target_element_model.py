@@ -1,6 +1,6 @@
 import unittest
 
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser
 
 from models.target_element import TargetElement
 
@@ -56,7 +56,7 @@ class TestTargetElementModel(unittest.TestCase):
         </div
         """
 
-        self.parser = HTMLParser(self.html)
+        self.parser = LexborHTMLParser(self.html)
 
     def test_collect_attributes_single_class(self):
         """Test collecting attributes with a single class value."""
@@ -87,6 +87,18 @@ class TestTargetElementModel(unittest.TestCase):
         expected_out = [".price_color.price_amount", "[id=1]"]
         self.assertEqual(expected_out, element.search_hierarchy)
 
+    def test_create_search_hierarchy_from_attributes(self):
+        element = TargetElement("test_element", 0)
+
+        element.create_search_hierarchy_from_attributes({'class': 'price_color price_amount', 'id': '1'})
+        self.assertEqual(element.search_hierarchy, ['.price_color.price_amount[id=1]'])
+
+        element.create_search_hierarchy_from_attributes({'css_selector': 'div > p'})
+        self.assertEqual(element.search_hierarchy, ['div > p'])
+
+        element.create_search_hierarchy_from_attributes({'id': '1', 'css_selector': 'div > p'})
+        self.assertEqual(element.search_hierarchy, ['[id=1]:is(div > p)'])
+
     def test_search_hierarchy_from_raw_hierarchy(self):
         hierarchy = TargetElement.create_search_hierarchy_from_raw_hierarchy(self.search_hierarchy_raw_one)
 